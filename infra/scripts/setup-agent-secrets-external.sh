@@ -146,10 +146,6 @@ if [[ ! -f "$SSH_PUBLIC_KEY_PATH" ]]; then
     fi
 fi
 
-# Read keys
-SSH_PRIVATE_KEY=$(cat "$SSH_KEY_PATH")
-SSH_PUBLIC_KEY=$(cat "$SSH_PUBLIC_KEY_PATH")
-
 # Secret names
 SECRET_NAME="agent-secrets-$GITHUB_USER"
 EXTERNAL_SECRET_NAME="agent-secrets-$GITHUB_USER"
@@ -160,30 +156,7 @@ log "Target namespace: $TARGET_NAMESPACE"
 log "SSH private key: $SSH_KEY_PATH"
 log "SSH public key: $SSH_PUBLIC_KEY_PATH"
 
-# Create or update secret in secret-store namespace
-log "Creating secret in secret-store namespace: $SECRET_NAME"
-
-if dry_run "kubectl create secret generic '$SECRET_NAME' in namespace '$SECRET_STORE_NAMESPACE'"; then
-    cat << EOF
-kubectl create secret generic "$SECRET_NAME" \\
-    --namespace="$SECRET_STORE_NAMESPACE" \\
-    --from-literal="SSH_PRIVATE_KEY=<SSH_PRIVATE_KEY>" \\
-    --from-literal="SSH_PUBLIC_KEY=<SSH_PUBLIC_KEY>" \\
-    --from-literal="GITHUB_TOKEN=$GITHUB_TOKEN" \\
-    --dry-run=client -o yaml | kubectl apply -f -
-EOF
-else
-    kubectl create secret generic "$SECRET_NAME" \
-        --namespace="$SECRET_STORE_NAMESPACE" \
-        --from-literal="SSH_PRIVATE_KEY=$SSH_PRIVATE_KEY" \
-        --from-literal="SSH_PUBLIC_KEY=$SSH_PUBLIC_KEY" \
-        --from-literal="GITHUB_TOKEN=$GITHUB_TOKEN" \
-        --dry-run=client -o yaml | kubectl apply -f -
-fi
-
-# Create ExternalSecret in target namespace
-log "Creating ExternalSecret in target namespace: $EXTERNAL_SECRET_NAME"
-
+# ExternalSecret in target namespace, synced from the secret-store secret
 EXTERNAL_SECRET_YAML=$(cat << EOF
 apiVersion: external-secrets.io/v1beta1
 kind: ExternalSecret
@@ -217,11 +190,36 @@ spec:
 EOF
 )
 
-if dry_run "kubectl apply ExternalSecret '$EXTERNAL_SECRET_NAME'"; then
+# Create or update the secret and its ExternalSecret with a single kubectl apply
+log "Creating secret in secret-store namespace: $SECRET_NAME"
+log "Creating ExternalSecret in target namespace: $EXTERNAL_SECRET_NAME"
+
+if dry_run "kubectl apply Secret '$SECRET_NAME' and ExternalSecret '$EXTERNAL_SECRET_NAME'"; then
+    cat << EOF
+{
+    kubectl create secret generic "$SECRET_NAME" \\
+        --namespace="$SECRET_STORE_NAMESPACE" \\
+        --from-file="SSH_PRIVATE_KEY=$SSH_KEY_PATH" \\
+        --from-file="SSH_PUBLIC_KEY=$SSH_PUBLIC_KEY_PATH" \\
+        --from-literal="GITHUB_TOKEN=$GITHUB_TOKEN" \\
+        --dry-run=client -o yaml
+    echo "---"
+    echo "<EXTERNAL_SECRET_YAML>"
+} | kubectl apply -f -
+EOF
     echo "DRY RUN: Would create ExternalSecret:"
     echo "$EXTERNAL_SECRET_YAML"
 else
-    echo "$EXTERNAL_SECRET_YAML" | kubectl apply -f -
+    {
+        kubectl create secret generic "$SECRET_NAME" \
+            --namespace="$SECRET_STORE_NAMESPACE" \
+            --from-file="SSH_PRIVATE_KEY=$SSH_KEY_PATH" \
+            --from-file="SSH_PUBLIC_KEY=$SSH_PUBLIC_KEY_PATH" \
+            --from-literal="GITHUB_TOKEN=$GITHUB_TOKEN" \
+            --dry-run=client -o yaml
+        echo "---"
+        echo "$EXTERNAL_SECRET_YAML"
+    } | kubectl apply -f -
 fi
 
 # Wait for ExternalSecret to sync
@@ -180,20 +180,19 @@ if [[ -z "$DRY_RUN" ]]; then
     fi
 fi
 
-# Create SSH secret
+# Create SSH and GitHub token secrets with a single kubectl apply
 log "Creating SSH secret: $SSH_SECRET_NAME"
-execute kubectl create secret generic "$SSH_SECRET_NAME" \
+log "Creating GitHub token secret: $TOKEN_SECRET_NAME"
+execute \{ kubectl create secret generic "$SSH_SECRET_NAME" \
     --namespace="$NAMESPACE" \
     --from-file=ssh-privatekey="$SSH_KEY_PATH" \
     --from-file=ssh-publickey="$SSH_PUB_PATH" \
-    --dry-run=client -o yaml \| kubectl apply -f -
-
-# Create GitHub token secret
-log "Creating GitHub token secret: $TOKEN_SECRET_NAME"
-execute kubectl create secret generic "$TOKEN_SECRET_NAME" \
+    --dry-run=client -o yaml \; \
+    echo "---" \; \
+    kubectl create secret generic "$TOKEN_SECRET_NAME" \
     --namespace="$NAMESPACE" \
     --from-literal=token="$GITHUB_TOKEN" \
-    --dry-run=client -o yaml \| kubectl apply -f -
+    --dry-run=client -o yaml \; \} \| kubectl apply -f -
 
 if [[ -z "$DRY_RUN" ]]; then
     echo ""
@@ -44,7 +44,7 @@ AUTOMATED WORKFLOW:
     1. Create agent directories with .env files containing GitHub PAT tokens
     2. Run: $0 --auto-generate
     3. Script automatically:
-       ✓ Generates SSH key pairs for each agent
+       ✓ Generates SSH key pairs for each agent (existing pairs are reused)
        ✓ Adds public keys to GitHub accounts via API
        ✓ Creates Kubernetes secrets
     4. You're done! No manual steps needed.
@@ -299,25 +299,46 @@ for agent_dir in "$AGENTS_DIR"/*; do
     ssh_private="$agent_dir/id_ed25519"
     ssh_public="$agent_dir/id_ed25519.pub"
 
-    # Generate SSH keys
-    info "🔑 Generating SSH key pair for agent: $agent_name"
-
-    if [[ -z "$DRY_RUN" ]]; then
-        # Generate SSH key pair
-        ssh-keygen -t ed25519 -f "$ssh_private" -N "" -C "${agent_name}@5dlabs.platform" -q
-
-        if [[ -f "$ssh_private" && -f "$ssh_public" ]]; then
-            # Set proper permissions
-            chmod 600 "$ssh_private"
-            chmod 644 "$ssh_public"
-            info "✅ Generated SSH key pair for: $agent_name"
+    # Reuse an existing SSH key pair on re-runs; only generate on first setup
+    if [[ -f "$ssh_private" && -f "$ssh_public" ]]; then
+        info "🔑 Reusing existing SSH key pair for agent: $agent_name"
+    elif [[ -f "$ssh_private" ]]; then
+        # Private key may already be registered with GitHub - derive the public key from it
+        info "🔑 Rebuilding SSH public key from existing private key for agent: $agent_name"
+
+        if [[ -z "$DRY_RUN" ]]; then
+            if ssh-keygen -y -f "$ssh_private" > "$ssh_public"; then
+                chmod 644 "$ssh_public"
+                info "✅ Rebuilt SSH public key for: $agent_name"
+            else
+                rm -f "$ssh_public"
+                error "Failed to rebuild SSH public key for: $agent_name"
+                FAILED_COUNT=$((FAILED_COUNT + 1))
+                continue
+            fi
         else
-            error "Failed to generate SSH key pair for: $agent_name"
-            FAILED_COUNT=$((FAILED_COUNT + 1))
-            continue
+            echo "DRY RUN: ssh-keygen -y -f $ssh_private > $ssh_public"
         fi
     else
-        echo "DRY RUN: ssh-keygen -t ed25519 -f $ssh_private -N \"\" -C \"${agent_name}@5dlabs.platform\" -q"
+        info "🔑 Generating SSH key pair for agent: $agent_name"
+
+        if [[ -z "$DRY_RUN" ]]; then
+            # Generate SSH key pair
+            ssh-keygen -t ed25519 -f "$ssh_private" -N "" -C "${agent_name}@5dlabs.platform" -q
+
+            if [[ -f "$ssh_private" && -f "$ssh_public" ]]; then
+                # Set proper permissions
+                chmod 600 "$ssh_private"
+                chmod 644 "$ssh_public"
+                info "✅ Generated SSH key pair for: $agent_name"
+            else
+                error "Failed to generate SSH key pair for: $agent_name"
+                FAILED_COUNT=$((FAILED_COUNT + 1))
+                continue
+            fi
+        else
+            echo "DRY RUN: ssh-keygen -t ed25519 -f $ssh_private -N \"\" -C \"${agent_name}@5dlabs.platform\" -q"
+        fi
     fi
 
     # Add SSH key to GitHub via API